@@ -7,8 +7,9 @@ from pathlib import Path
 import streamlit as st
 
 
-def render_hpe_badge() -> None:
-    """Render an HPE PCAI badge at the bottom of the sidebar."""
+@st.cache_resource(show_spinner=False)
+def _hpe_badge_html() -> str:
+    """Build the card HTML, reading and encoding the hero image once per process."""
     hpe_url = "https://hpe.com/ai"
 
     # Load HPE hero image
@@ -147,5 +148,10 @@ def render_hpe_badge() -> None:
     </a>
     """
 
+    return card_css + card_html
+
+
+def render_hpe_badge() -> None:
+    """Render an HPE PCAI badge at the bottom of the sidebar."""
     with st.sidebar.container():
-        st.markdown(card_css + card_html, unsafe_allow_html=True)
+        st.markdown(_hpe_badge_html(), unsafe_allow_html=True)
@@ -7,8 +7,9 @@ from pathlib import Path
 import streamlit as st
 
 
-def render_wan22_badge() -> None:
-    """Render a Wan2.2 badge at the top of the sidebar with logo and info."""
+@st.cache_resource(show_spinner=False)
+def _wan22_badge_html() -> str:
+    """Build the badge HTML once so the logo is not re-encoded on every rerun."""
     wan22_url = "https://github.com/Wan-Video/Wan2.2"
 
     # Load Wan2.2 logo
@@ -146,5 +147,10 @@ def render_wan22_badge() -> None:
     </a>
     """
 
+    return card_css + card_html
+
+
+def render_wan22_badge() -> None:
+    """Render a Wan2.2 badge at the top of the sidebar with logo and info."""
     with st.sidebar.container():
-        st.markdown(card_css + card_html, unsafe_allow_html=True)
+        st.markdown(_wan22_badge_html(), unsafe_allow_html=True)
@@ -40,9 +40,9 @@ columns = 3
 
 # Apply sorting
 if sort_by == "Newest First":
-    sorted_projects = sorted(filtered_projects, key=lambda x: x[1].timestamp, reverse=True)
+    sorted_projects = sorted(filtered_projects, key=lambda x: x[1].timestamp_epoch, reverse=True)
 elif sort_by == "Oldest First":
-    sorted_projects = sorted(filtered_projects, key=lambda x: x[1].timestamp, reverse=False)
+    sorted_projects = sorted(filtered_projects, key=lambda x: x[1].timestamp_epoch, reverse=False)
 elif sort_by == "Resolution":
     sorted_projects = sorted(filtered_projects, key=lambda x: x[1].resolution, reverse=True)
 elif sort_by == "Duration":
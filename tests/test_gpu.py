@@ -0,0 +1,24 @@
+"""Tests for GPU utilities."""
+
+from unittest.mock import patch
+
+from utils.gpu import _GpuMonitor
+
+
+def test_monitor_backs_off_after_stream_ends():
+    """Test a dead monitor is not restarted on every snapshot call."""
+    clock = [1000.0]
+    monitor = _GpuMonitor(restart_backoff=60, clock=lambda: clock[0])
+
+    with patch("utils.gpu._query_gpu_info", return_value=[]) as mock_query:
+        assert monitor.snapshot() == []
+        monitor._thread.join()
+
+        clock[0] += 30
+        assert monitor.snapshot() is None
+        assert mock_query.call_count == 1
+
+        clock[0] += 31
+        assert monitor.snapshot() == []
+        monitor._thread.join()
+        assert mock_query.call_count == 2
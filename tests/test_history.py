@@ -1,12 +1,15 @@
 """Tests for output history system."""
 
+import os
+from dataclasses import replace
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 import streamlit as st
 
-from utils.history import OutputHistory
+from utils.history import OutputHistory, _project_mtime_ns
 from utils.metadata import GenerationMetadata
 
 
@@ -183,3 +186,81 @@ def test_render_project_card_expands_video_on_click(
     # Verify video shown after toggle
     mock_image.assert_called_once()
     mock_video.assert_called_once_with(str(video_path))
+
+
+def test_filter_projects_combines_criteria(tmp_path, mock_metadata):
+    """Test all filters are applied together in one pass."""
+    match = mock_metadata
+    other_task = replace(mock_metadata, task="i2v-A14B")
+    too_old = replace(mock_metadata, timestamp="2026-01-01T10:00:00")
+    extended_only = replace(
+        mock_metadata, user_prompt="unrelated", extended_prompt="A TEST scene"
+    )
+    projects = [
+        (tmp_path / "match", match),
+        (tmp_path / "other_task", other_task),
+        (tmp_path / "too_old", too_old),
+        (tmp_path / "extended_only", extended_only),
+    ]
+
+    history = OutputHistory(tmp_path)
+    filtered = history.filter_projects(
+        projects,
+        task="t2v-A14B",
+        date_from=datetime(2026, 2, 1),
+        date_to=datetime(2026, 2, 5),
+        resolution="1280*720",
+        search_text="Test",
+    )
+
+    assert [p[0].name for p in filtered] == ["match", "extended_only"]
+
+
+def test_scan_projects_loads_metadata_newest_first(tmp_path, mock_metadata):
+    """Test scanning skips folders without metadata and sorts newest first."""
+    for name, timestamp in [
+        ("older", "2026-02-03T10:00:00"),
+        ("newer", "2026-02-05T10:00:00"),
+    ]:
+        replace(mock_metadata, timestamp=timestamp).save(
+            tmp_path / name / "metadata.json"
+        )
+    (tmp_path / "no_metadata").mkdir()
+    (tmp_path / "stray_file.txt").write_text("not a project")
+
+    history = OutputHistory(tmp_path)
+    projects = history.scan_projects()
+
+    assert [p[0].name for p in projects] == ["newer", "older"]
+    assert projects[0][1].timestamp == "2026-02-05T10:00:00"
+
+
+def test_get_recent_tops_up_after_unreadable_metadata(tmp_path, mock_metadata):
+    """Test a broken metadata.json in the window does not shrink the result."""
+    for i in range(1, 4):
+        metadata_path = tmp_path / f"proj{i}" / "metadata.json"
+        replace(mock_metadata, timestamp=f"2026-02-0{i}T10:00:00").save(metadata_path)
+        os.utime(metadata_path, ns=(i * 10**9, i * 10**9))
+    broken = tmp_path / "broken" / "metadata.json"
+    broken.parent.mkdir()
+    broken.write_text("{not json")
+    os.utime(broken, ns=(10 * 10**9, 10 * 10**9))
+
+    history = OutputHistory(tmp_path)
+
+    assert [p[0].name for p in history.get_recent(2)] == ["proj3", "proj2"]
+
+
+def test_project_mtime_tracks_files_rewritten_in_place(tmp_path):
+    """Test the zip cache key changes when a file is overwritten in place."""
+    video = tmp_path / "output.mp4"
+    video.write_bytes(b"v1")
+    os.utime(video, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(tmp_path, ns=(2_000_000_000, 2_000_000_000))
+    before = _project_mtime_ns(tmp_path)
+
+    video.write_bytes(b"v2")
+    os.utime(video, ns=(3_000_000_000, 3_000_000_000))
+    os.utime(tmp_path, ns=(2_000_000_000, 2_000_000_000))
+
+    assert _project_mtime_ns(tmp_path) == 3_000_000_000 != before
@@ -0,0 +1,192 @@
+"""Tests for the generation queue."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import utils.queue as queue_module
+from utils.queue import GenerationQueue
+
+
+def test_jobs_acquire_in_submission_order():
+    """Test only the head of the queue can take the generation slot."""
+    queue = GenerationQueue()
+    queue.submit("first", "t2v-A14B", "a cat")
+    queue.submit("second", "i2v-A14B", "a dog")
+
+    assert queue.get_position("second") == 1
+    assert queue.try_acquire("second") is False
+    assert queue.try_acquire("first") is True
+    assert queue.get_position("second") == 0
+
+    # Slot is busy until the running job releases it
+    assert queue.try_acquire("second") is False
+    queue.release("first")
+    assert queue.try_acquire("second") is True
+
+
+def test_positions_shift_after_cancel():
+    """Test cancelling a waiting job moves the jobs behind it forward."""
+    queue = GenerationQueue()
+    for job_id in ("a", "b", "c"):
+        queue.submit(job_id, "t2v-A14B", job_id)
+
+    queue.cancel("b")
+
+    assert queue.get_position("a") == 0
+    assert queue.get_position("b") == -1
+    assert queue.get_position("c") == 1
+
+
+def test_stale_active_job_is_reclaimed():
+    """Test a job that never releases stops blocking the queue after the limit."""
+    clock = [1000.0]
+    queue = GenerationQueue(max_job_duration=60, clock=lambda: clock[0])
+    queue.submit("lost", "t2v-A14B", "a cat")
+    queue.submit("next", "i2v-A14B", "a dog")
+    assert queue.try_acquire("lost") is True
+
+    clock[0] += 30
+    queue.heartbeat("next")
+    assert queue.try_acquire("next") is False
+
+    clock[0] += 31
+    assert queue.try_acquire("next") is True
+    # A late release from the reclaimed job must not free the new holder's slot
+    queue.release("lost")
+    assert queue.get_active_info().task == "i2v-A14B"
+
+
+def test_abandoned_waiting_job_is_dropped():
+    """Test a queued job whose session stopped checking in no longer blocks."""
+    clock = [1000.0]
+    queue = GenerationQueue(waiter_timeout=60, clock=lambda: clock[0])
+    queue.submit("abandoned", "t2v-A14B", "a cat")
+    queue.submit("live", "i2v-A14B", "a dog")
+
+    clock[0] += 30
+    queue.heartbeat("live")
+    assert queue.try_acquire("live") is False
+
+    clock[0] += 31
+    queue.heartbeat("live")
+    assert queue.try_acquire("live") is True
+    assert queue.get_position("abandoned") == -1
+    assert queue.get_queue_length() == 0
+
+
+def test_wait_until_changed_wakes_on_release():
+    """Test waiters are woken by a release instead of sleeping out the timeout."""
+    queue = GenerationQueue()
+    queue.submit("running", "t2v-A14B", "a cat")
+    assert queue.try_acquire("running") is True
+    version = queue.version
+
+    timer = threading.Timer(0.05, queue.release, args=("running",))
+    start = time.monotonic()
+    timer.start()
+    new_version = queue.wait_until_changed(version, timeout=5.0)
+    elapsed = time.monotonic() - start
+    timer.join()
+
+    assert new_version != version
+    assert elapsed < 1.0
+
+
+def test_wait_until_changed_returns_immediately_if_already_changed():
+    """Test a change between reading the version and waiting is not missed."""
+    queue = GenerationQueue()
+    version = queue.version
+    queue.submit("job", "t2v-A14B", "a cat")
+
+    start = time.monotonic()
+    queue.wait_until_changed(version, timeout=5.0)
+
+    assert time.monotonic() - start < 1.0
+
+
+def test_queue_status_message_tracks_changes(monkeypatch):
+    """Test the cached status message is refreshed when the queue changes."""
+    queue = GenerationQueue()
+    monkeypatch.setattr(queue_module, "generation_queue", queue)
+    monkeypatch.setattr(queue_module, "_status_cache", None)
+
+    assert queue_module.get_queue_status_message() is None
+
+    queue.submit("first", "t2v-A14B", "a cat")
+    queue.submit("second", "i2v-A14B", "a dog")
+    assert queue.try_acquire("first") is True
+    assert (
+        queue_module.get_queue_status_message()
+        == "1 generation running (t2v-A14B), 1 in queue"
+    )
+
+    queue.release("first")
+    assert queue_module.get_queue_status_message() == "1 in queue"
+
+
+def test_wait_for_queue_turn_writes_position_only_when_it_changes(monkeypatch):
+    """Test a waiter parked at the same position does not repeat its update."""
+    queue = GenerationQueue()
+    queue.submit("running", "t2v-A14B", "a cat")
+    assert queue.try_acquire("running") is True
+    queue.submit("waiting", "i2v-A14B", "a dog")
+    monkeypatch.setattr(queue_module, "generation_queue", queue)
+    monkeypatch.setattr(queue, "wait_until_changed", lambda version, timeout: version)
+    mock_st = MagicMock()
+    monkeypatch.setattr(queue_module, "st", mock_st)
+
+    checks = iter([False, False, False, True])
+    assert queue_module.wait_for_queue_turn("waiting", lambda: next(checks)) is False
+
+    mock_st.write.assert_called_once_with("Position in queue: 1 (running: t2v-A14B)")
+
+
+def test_wait_for_queue_turn_yields_to_streamlit_each_iteration(monkeypatch):
+    """Test a waiter without a cancellation check stays interruptible."""
+    queue = GenerationQueue()
+    queue.submit("running", "t2v-A14B", "a cat")
+    assert queue.try_acquire("running") is True
+    queue.submit("waiting", "i2v-A14B", "a dog")
+    monkeypatch.setattr(queue_module, "generation_queue", queue)
+    mock_st = MagicMock()
+    monkeypatch.setattr(queue_module, "st", mock_st)
+
+    waits = []
+
+    def fake_wait(version, timeout):
+        waits.append(version)
+        if len(waits) == 3:
+            queue.release("running")
+        return version
+
+    monkeypatch.setattr(queue, "wait_until_changed", fake_wait)
+
+    assert queue_module.wait_for_queue_turn("waiting") is True
+
+    # Three idle wakeups plus the iteration that acquired the slot
+    assert len(waits) == 3
+    assert mock_st.session_state.get.call_count == 4
+    mock_st.write.assert_called_once()
+
+
+def test_wait_for_queue_turn_cancels_when_interrupted(monkeypatch):
+    """Test a stop/rerun raised while waiting removes the job from the queue."""
+    queue = GenerationQueue()
+    queue.submit("running", "t2v-A14B", "a cat")
+    assert queue.try_acquire("running") is True
+    queue.submit("waiting", "i2v-A14B", "a dog")
+    queue.submit("behind", "i2v-A14B", "a bird")
+    monkeypatch.setattr(queue_module, "generation_queue", queue)
+    mock_st = MagicMock()
+    # Streamlit raises its stop/rerun exceptions from session state access
+    mock_st.session_state.get.side_effect = KeyboardInterrupt
+    monkeypatch.setattr(queue_module, "st", mock_st)
+
+    with pytest.raises(KeyboardInterrupt):
+        queue_module.wait_for_queue_turn("waiting")
+
+    assert queue.get_position("waiting") == -1
+    assert queue.get_position("behind") == 0
@@ -0,0 +1,20 @@
+"""Tests for theme utilities."""
+
+from utils.theme import minify_css
+
+
+def test_minify_css_strips_comments_and_whitespace():
+    """Test comments and layout whitespace are dropped but selectors survive."""
+    css = """
+    /* Sidebar */
+    [data-testid="stSidebar"] > div:first-child,
+    .card p {
+        margin: 0 auto;   /* centred */
+        font-family: 'Outfit', sans-serif;
+    }
+    """
+
+    assert minify_css(css) == (
+        '[data-testid="stSidebar"]>div:first-child,.card p'
+        "{margin: 0 auto;font-family: 'Outfit',sans-serif;}"
+    )
@@ -0,0 +1,141 @@
+"""Tests for media validation utilities."""
+
+from fractions import Fraction
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from PIL import Image
+
+from utils.validation import _image_size, get_audio_info, get_video_info
+
+
+class _StubFFmpegError(Exception):
+    """Stand-in for av.FFmpegError."""
+
+
+class _StubContainer:
+    """Minimal stand-in for a PyAV input container."""
+
+    def __init__(self, duration, video=(), audio=()):
+        self.duration = duration
+        self.streams = SimpleNamespace(video=list(video), audio=list(audio))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def _stub_av(container=None, error=None):
+    """A stub av module whose open() returns container or raises error."""
+
+    def open_container(path):
+        if error is not None:
+            raise error
+        return container
+
+    return SimpleNamespace(
+        open=open_container, time_base=1_000_000, FFmpegError=_StubFFmpegError
+    )
+
+
+def test_get_video_info_ffprobe_fallback():
+    """Test ffprobe output is parsed when PyAV is unavailable."""
+    stdout = (
+        b'{"streams": [{"width": 1280, "height": 720, "codec_name": "h264", '
+        b'"r_frame_rate": "30000/1001"}], "format": {"duration": "5.5"}}'
+    )
+
+    with patch("utils.validation._load_av", return_value=None), patch(
+        "subprocess.run", return_value=Mock(returncode=0, stdout=stdout)
+    ) as mock_run:
+        info = get_video_info(Path("clip.mp4"))
+
+    assert info == {
+        "width": 1280,
+        "height": 720,
+        "duration": 5.5,
+        "fps": 30000 / 1001,
+        "codec": "h264",
+    }
+    cmd = mock_run.call_args[0][0]
+    assert cmd[cmd.index("-select_streams") + 1] == "v:0"
+
+
+def test_get_video_info_pyav():
+    """Test video info is read from the PyAV stream and container."""
+    stream = SimpleNamespace(
+        base_rate=None,
+        average_rate=Fraction(30000, 1001),
+        codec_context=SimpleNamespace(width=1280, height=720, name="h264"),
+    )
+    av = _stub_av(_StubContainer(duration=5_500_000, video=[stream]))
+
+    with patch("utils.validation._load_av", return_value=av):
+        info = get_video_info(Path("clip.mp4"))
+
+    assert info == {
+        "width": 1280,
+        "height": 720,
+        "duration": 5.5,
+        "fps": 30000 / 1001,
+        "codec": "h264",
+    }
+
+
+def test_get_audio_info_pyav():
+    """Test audio info is read from the PyAV stream and container."""
+    stream = SimpleNamespace(
+        codec_context=SimpleNamespace(sample_rate=44100, channels=2, name="aac")
+    )
+    av = _stub_av(_StubContainer(duration=None, audio=[stream]))
+
+    with patch("utils.validation._load_av", return_value=av):
+        info = get_audio_info(Path("voice.m4a"))
+
+    assert info == {
+        "duration": 0.0,
+        "sample_rate": 44100,
+        "channels": 2,
+        "codec": "aac",
+    }
+
+
+def test_get_video_info_pyav_unreadable_file():
+    """Test a file PyAV cannot decode reports no info."""
+    av = _stub_av(error=_StubFFmpegError("Invalid data found"))
+
+    with patch("utils.validation._load_av", return_value=av):
+        assert get_video_info(Path("clip.mp4")) is None
+
+
+def test_get_video_info_pyav_api_mismatch_is_not_swallowed():
+    """Test an unexpected PyAV API raises instead of rejecting every upload."""
+    stream = SimpleNamespace(base_rate=None, average_rate=None, codec_context=None)
+    av = _stub_av(_StubContainer(duration=None, video=[stream]))
+
+    with patch("utils.validation._load_av", return_value=av):
+        with pytest.raises(AttributeError):
+            get_video_info(Path("clip.mp4"))
+
+
+def test_image_size_uses_header_parser(tmp_path):
+    """Test imagesize's header result is used without opening the image."""
+    stub = SimpleNamespace(get=Mock(return_value=(640, 480)))
+
+    with patch("utils.validation.imagesize", stub):
+        assert _image_size(tmp_path / "missing.png") == (640, 480)
+
+
+def test_image_size_falls_back_to_pil(tmp_path):
+    """Test formats imagesize cannot parse are measured with PIL."""
+    image_path = tmp_path / "image.png"
+    Image.new("RGB", (32, 16)).save(image_path)
+    stub = SimpleNamespace(get=Mock(return_value=(-1, -1)))
+
+    with patch("utils.validation.imagesize", stub):
+        assert _image_size(image_path) == (32, 16)
+    stub.get.assert_called_once_with(str(image_path))
@@ -2,8 +2,13 @@
 GPU utilities for detecting and managing NVIDIA GPUs.
 """
 
+import heapq
 import subprocess
+import threading
+import time
+from typing import Callable
 
+import numpy as np
 import streamlit as st
 
 
@@ -14,6 +19,11 @@ def get_available_gpus() -> int:
     Returns:
         int: Number of GPUs detected, defaults to 1 if detection fails
     """
+    gpu_info = get_gpu_info()
+    if gpu_info:
+        return len(gpu_info)
+
+    # Detailed query failed - fall back to a plain name listing
     try:
         result = subprocess.run(
             ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"],
@@ -26,47 +36,206 @@ def get_available_gpus() -> int:
         return 1
 
 
-def get_gpu_info() -> list[dict]:
-    """
-    Get detailed GPU information including memory usage.
+# Seconds a session reuses its GPU snapshot before querying again
+GPU_INFO_TTL_SECONDS = 10
 
-    Returns:
-        list[dict]: List of GPU information dictionaries with keys:
-            - index: GPU index
-            - name: GPU model name
-            - memory_total_mb: Total memory in MB
-            - memory_used_mb: Used memory in MB
-            - memory_free_mb: Free memory in MB
-    """
+# Seconds before restarting a monitor whose nvidia-smi stream ended
+MONITOR_RESTART_BACKOFF_SECONDS = 60
+
+_GPU_QUERY = "--query-gpu=index,name,memory.total,memory.used,memory.free"
+_GPU_FORMAT = "--format=csv,noheader,nounits"
+
+
+def _parse_gpu_line(line: str) -> dict | None:
+    """Parse one CSV line of nvidia-smi GPU query output."""
+    parts = [p.strip() for p in line.split(",")]
+    if len(parts) < 5:
+        return None
+    try:
+        return {
+            "index": int(parts[0]),
+            "name": parts[1],
+            "memory_total_mb": int(parts[2]),
+            "memory_used_mb": int(parts[3]),
+            "memory_free_mb": int(parts[4]),
+        }
+    except ValueError:
+        return None
+
+
+def _query_gpu_info() -> list[dict]:
+    """Run a one-shot nvidia-smi query for per-GPU memory information."""
     try:
         result = subprocess.run(
-            [
-                "nvidia-smi",
-                "--query-gpu=index,name,memory.total,memory.used,memory.free",
-                "--format=csv,noheader,nounits",
-            ],
+            ["nvidia-smi", _GPU_QUERY, _GPU_FORMAT],
             capture_output=True,
             text=True,
             check=True,
         )
         gpus = []
         for line in result.stdout.strip().split("\n"):
-            parts = [p.strip() for p in line.split(",")]
-            if len(parts) >= 5:
-                gpus.append(
-                    {
-                        "index": int(parts[0]),
-                        "name": parts[1],
-                        "memory_total_mb": int(parts[2]),
-                        "memory_used_mb": int(parts[3]),
-                        "memory_free_mb": int(parts[4]),
-                    }
-                )
+            gpu = _parse_gpu_line(line)
+            if gpu is not None:
+                gpus.append(gpu)
         return gpus
     except Exception:
         return []
 
 
+class _GpuMonitor:
+    """
+    Background sampler that keeps the latest GPU memory snapshot in memory.
+
+    A single long-running ``nvidia-smi -lms`` process streams samples, so page
+    reruns read the snapshot instead of paying nvidia-smi startup on every call.
+    If the stream ends, the monitor stays down for a backoff period so callers
+    fall back to one-shot queries instead of respawning it on every call.
+    """
+
+    def __init__(
+        self,
+        interval_ms: int = 1000,
+        restart_backoff: float = MONITOR_RESTART_BACKOFF_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._interval_ms = interval_ms
+        self._restart_backoff = restart_backoff
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._snapshot: list[dict] = []
+        self._thread: threading.Thread | None = None
+        # Clock reading when the sampling thread last exited
+        self._stopped_at: float | None = None
+
+    def start(self) -> bool:
+        """
+        Start the sampling thread if it is not already running.
+
+        Returns:
+            bool: True if the thread is running, False while backing off
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return True
+            if (
+                self._stopped_at is not None
+                and self._clock() - self._stopped_at < self._restart_backoff
+            ):
+                return False
+            self._ready.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="gpu-monitor", daemon=True
+            )
+            self._thread.start()
+            return True
+
+    def snapshot(self, timeout: float = 1.0) -> list[dict] | None:
+        """
+        Get the latest per-GPU info.
+
+        Returns:
+            Copy of the latest snapshot, or None if no data arrived within timeout
+            or the monitor is backing off after its stream ended
+        """
+        if not self.start():
+            return None
+        if not self._ready.wait(timeout):
+            return None
+        with self._lock:
+            return [dict(gpu) for gpu in self._snapshot]
+
+    def _publish(self, gpus) -> None:
+        snapshot = sorted(gpus, key=lambda g: g["index"])
+        with self._lock:
+            self._snapshot = snapshot
+        self._ready.set()
+
+    def _run(self) -> None:
+        try:
+            # Seed with a one-shot query so the first reader gets a full sample
+            initial = _query_gpu_info()
+            self._publish(initial)
+            if not initial:
+                return
+
+            proc = subprocess.Popen(
+                [
+                    "nvidia-smi",
+                    _GPU_QUERY,
+                    _GPU_FORMAT,
+                    "-lms",
+                    str(self._interval_ms),
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+            expected = len(initial)
+            pending: dict[int, dict] = {}
+            with proc.stdout:
+                for line in proc.stdout:
+                    gpu = _parse_gpu_line(line)
+                    if gpu is None:
+                        continue
+                    # A repeated index means the previous sample was short
+                    if gpu["index"] in pending:
+                        self._publish(pending.values())
+                        pending = {}
+                    pending[gpu["index"]] = gpu
+                    if len(pending) >= expected:
+                        self._publish(pending.values())
+                        pending = {}
+            proc.wait()
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                self._stopped_at = self._clock()
+            self._ready.set()
+
+
+_gpu_monitor = _GpuMonitor()
+
+
+def get_gpu_info() -> list[dict]:
+    """
+    Get detailed GPU information including memory usage.
+
+    Reads the background monitor's latest sample, falling back to a one-shot
+    nvidia-smi query if no sample is available yet.
+
+    Returns:
+        list[dict]: List of GPU information dictionaries with keys:
+            - index: GPU index
+            - name: GPU model name
+            - memory_total_mb: Total memory in MB
+            - memory_used_mb: Used memory in MB
+            - memory_free_mb: Free memory in MB
+    """
+    gpus = _gpu_monitor.snapshot()
+    if gpus is None:
+        return _query_gpu_info()
+    return gpus
+
+
+def _gpu_row_html(gpu: dict, usage_pct: float, bar_color: str, free_gb: float) -> str:
+    """Build the HTML for one GPU's header, memory usage bar and free memory."""
+    return (
+        f"<div class='gpu-row'>"
+        f"<div class='gpu-row-header'>"
+        f"<strong>GPU {gpu['index']}</strong> <span>{gpu['name']}</span>"
+        f"</div>"
+        f"<div class='gpu-row-stats'>"
+        f"<div class='gpu-usage'>{bar_color} {usage_pct*100:.1f}% used"
+        f"<div class='gpu-usage-bar'>"
+        f"<div class='gpu-usage-fill' style='width: {usage_pct*100:.1f}%;'></div>"
+        f"</div></div>"
+        f"<div class='gpu-free'><strong>{free_gb:.1f} GB</strong> free</div>"
+        f"</div></div>"
+    )
+
+
 def render_gpu_selector(default_value: int = 1, allow_gpu_selection: bool = True, num_heads: int | None = None) -> tuple[int, list[int] | None]:
     """
     Render GPU selection widget with visual memory usage indicators.
@@ -82,60 +251,52 @@ def render_gpu_selector(default_value: int = 1, allow_gpu_selection: bool = True
             - num_gpus: Number of GPUs to use
             - gpu_ids: List of specific GPU IDs to use, or None for default (0 to num_gpus-1)
     """
-    available_gpus = get_available_gpus()
-    gpu_info = get_gpu_info()
-
     st.subheader("GPU Configuration")
 
+    # Reuse this session's GPU snapshot across widget reruns; probe again only
+    # when it expires or the user asks for a refresh
+    refresh = st.button("🔄 Refresh GPU info", key="gpu_info_refresh")
+    snapshot = st.session_state.get("gpu_info_snapshot")
+    if (
+        refresh
+        or snapshot is None
+        or time.monotonic() - snapshot[0] > GPU_INFO_TTL_SECONDS
+    ):
+        # Single nvidia-smi query provides both the GPU count and per-GPU details
+        snapshot = (time.monotonic(), get_gpu_info())
+        st.session_state["gpu_info_snapshot"] = snapshot
+    gpu_info = snapshot[1]
+    available_gpus = len(gpu_info) or 1
+
     # Display GPU usage visualization
     selected_gpu_ids = []
     if gpu_info:
-        for gpu in gpu_info:
-            # Create columns for checkbox and GPU info
-            if allow_gpu_selection:
+        # Compute usage levels and indicator colors for all GPUs in one pass
+        used_mb = np.fromiter((g["memory_used_mb"] for g in gpu_info), dtype=float)
+        total_mb = np.fromiter((g["memory_total_mb"] for g in gpu_info), dtype=float)
+        free_gb = np.fromiter((g["memory_free_mb"] for g in gpu_info), dtype=float) / 1024
+        usage = used_mb / np.maximum(total_mb, 1)
+        bar_colors = np.where(usage > 0.9, "🔴", np.where(usage > 0.7, "🟡", "🟢"))
+
+        # Each GPU's header, usage bar and free memory render as one HTML block
+        rows_html = [
+            _gpu_row_html(gpu, float(usage[i]), bar_colors[i], free_gb[i])
+            for i, gpu in enumerate(gpu_info)
+        ]
+
+        if allow_gpu_selection:
+            for i, gpu in enumerate(gpu_info):
                 col_check, col_info = st.columns([0.5, 9.5])
-            else:
-                col_info = st.container()
-                col_check = None
-
-            with col_info:
-                # GPU header
-                st.markdown(
-                    f"<div style='margin-bottom: 0.5rem;'>"
-                    f"<strong style='color: var(--text-primary);'>GPU {gpu['index']}</strong> "
-                    f"<span style='color: var(--text-secondary); font-size: 0.85rem;'>{gpu['name']}</span>"
-                    f"</div>",
-                    unsafe_allow_html=True,
-                )
-
-                # Memory usage bar and stats
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    usage_pct = gpu["memory_used_mb"] / gpu["memory_total_mb"]
-                    # Color based on usage level
-                    if usage_pct > 0.9:
-                        bar_color = "🔴"
-                    elif usage_pct > 0.7:
-                        bar_color = "🟡"
-                    else:
-                        bar_color = "🟢"
-                    st.progress(
-                        usage_pct,
-                        text=f"{bar_color} {usage_pct*100:.1f}% used",
-                    )
-                with col2:
-                    free_gb = gpu["memory_free_mb"] / 1024
-                    st.caption(f"**{free_gb:.1f} GB** free")
-
-            # Add checkbox for GPU selection if enabled
-            if allow_gpu_selection and col_check:
+                with col_info:
+                    st.markdown(rows_html[i], unsafe_allow_html=True)
                 with col_check:
                     # Auto-check GPUs with <80% usage
-                    default_checked = usage_pct < 0.8
-                    if st.checkbox("", value=default_checked, key=f"gpu_{gpu['index']}_select", label_visibility="collapsed"):
+                    default_checked = usage[i] < 0.8
+                    if st.checkbox("", value=bool(default_checked), key=f"gpu_{gpu['index']}_select", label_visibility="collapsed"):
                         selected_gpu_ids.append(gpu["index"])
-
-            st.markdown("<div style='margin-bottom: 1rem;'></div>", unsafe_allow_html=True)
+        else:
+            # Display only - no widgets needed, so emit every GPU in one element
+            st.markdown("".join(rows_html), unsafe_allow_html=True)
 
     else:
         st.info(f"{available_gpus} GPU(s) detected (detailed info unavailable)")
@@ -158,7 +319,10 @@ def render_gpu_selector(default_value: int = 1, allow_gpu_selection: bool = True
         if num_heads is not None and num_gpus not in valid_gpu_counts:
             # Fall back to largest valid count
             num_gpus = max([v for v in valid_gpu_counts if v <= len(selected_gpu_ids)] or [1])
-            gpu_ids_to_use = sorted(selected_gpu_ids)[:num_gpus]
+            # Keep the selected GPUs with the most free memory
+            free_by_index = {g["index"]: g["memory_free_mb"] for g in gpu_info}
+            freest = heapq.nlargest(num_gpus, selected_gpu_ids, key=free_by_index.get)
+            gpu_ids_to_use = sorted(freest)
     else:
         # Use slider for GPU count
         if num_heads is not None and len(valid_gpu_counts) < available_gpus:
@@ -7,6 +7,7 @@ import io
 import os
 import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Tuple
@@ -17,6 +18,76 @@ from utils.common import extract_thumbnail
 from utils.config import OUTPUT_ROOT
 from utils.metadata import GenerationMetadata
 
+# Worker threads used to load project metadata in parallel
+SCAN_WORKERS = 8
+
+
+@st.cache_data(show_spinner=False)
+def _load_metadata_cached(metadata_path: str, mtime_ns: int) -> GenerationMetadata:
+    """
+    Load project metadata, memoized across reruns.
+
+    Keyed on the file's modification time so a rewritten metadata.json is
+    picked up on the next scan.
+    """
+    return GenerationMetadata.load(metadata_path)
+
+
+def _load_project_entry(
+    metadata_path: str, mtime_ns: int
+) -> GenerationMetadata | Exception:
+    """
+    Load metadata for one project.
+
+    Runs on scan worker threads, so errors are returned rather than reported
+    here; the caller emits the Streamlit warning.
+
+    Returns:
+        Metadata, or the error raised while loading it
+    """
+    try:
+        return _load_metadata_cached(metadata_path, mtime_ns)
+    except Exception as e:
+        return e
+
+
+@st.cache_resource(show_spinner=False, ttl=3600, max_entries=2)
+def _build_project_zip(project_dir: str, mtime_ns: int) -> bytes:
+    """
+    Package a project directory as a zip archive, memoized per newest file mtime.
+
+    Files are stored uncompressed since the bulk of a project is already
+    compressed video. Archives are mostly video and can be large, so only a
+    couple are kept, and cache_resource hands back the stored bytes on reruns
+    instead of unpickling a fresh copy the way cache_data would.
+    """
+    root = Path(project_dir)
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_STORED) as zip_file:
+        # Add all files from project directory
+        for file_path in root.rglob("*"):
+            if file_path.is_file():
+                zip_file.write(file_path, file_path.relative_to(root))
+    return zip_buffer.getvalue()
+
+
+def _project_mtime_ns(project_dir: Path) -> int:
+    """
+    Newest modification time of any file in a project.
+
+    The directory's own mtime only changes when entries are added or removed,
+    so it would miss a file rewritten in place.
+    """
+    return max(
+        (p.stat().st_mtime_ns for p in project_dir.rglob("*") if p.is_file()),
+        default=project_dir.stat().st_mtime_ns,
+    )
+
+
+def _clear_zip_request(zip_key: str) -> None:
+    """Forget a prepared download so its archive is not rebuilt on every rerun."""
+    st.session_state.pop(zip_key, None)
+
 
 class OutputHistory:
     """Manages the output history and provides gallery views."""
@@ -30,36 +101,71 @@ class OutputHistory:
         """
         self.output_root = output_root
 
-    def scan_projects(self) -> List[Tuple[Path, GenerationMetadata]]:
+    def scan_projects(
+        self, limit: Optional[int] = None
+    ) -> List[Tuple[Path, GenerationMetadata]]:
         """
         Scan output directories for metadata.json files.
 
+        Args:
+            limit: Only load metadata for the N most recently written projects
+
         Returns:
             List of tuples (project_dir, metadata) sorted by timestamp (newest first)
         """
         projects: List[Tuple[Path, GenerationMetadata]] = []
 
-        if not self.output_root.exists():
+        # DirEntry caches the file type from the directory listing, so only
+        # metadata.json needs a stat per project
+        try:
+            with os.scandir(self.output_root) as it:
+                entries = [entry for entry in it if entry.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
             return projects
 
-        # Scan all subdirectories for metadata.json
-        for project_dir in self.output_root.iterdir():
-            if not project_dir.is_dir():
+        candidates = []
+        for entry in entries:
+            metadata_path = os.path.join(entry.path, "metadata.json")
+            try:
+                mtime_ns = os.stat(metadata_path).st_mtime_ns
+            except FileNotFoundError:
                 continue
+            candidates.append((entry, metadata_path, mtime_ns))
+
+        # metadata.json is written when a generation finishes, so its mtime
+        # orders projects without parsing them; only the requested window is
+        # loaded
+        candidates.sort(key=lambda c: c[2], reverse=True)
+        wanted = len(candidates) if limit is None else limit
+
+        # Unchanged files are served from cache instead of being re-read and
+        # re-parsed on every rerun. Loading is I/O bound, so reads are
+        # overlapped across worker threads. Unreadable projects do not count
+        # towards the limit, so the window is topped up from older candidates.
+        start = 0
+        while len(projects) < wanted and start < len(candidates):
+            batch = candidates[start:start + wanted - len(projects)]
+            start += len(batch)
+
+            workers = min(SCAN_WORKERS, len(batch))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(
+                    pool.map(
+                        _load_project_entry,
+                        [c[1] for c in batch],
+                        [c[2] for c in batch],
+                    )
+                )
 
-            metadata_path = project_dir / "metadata.json"
-            if not metadata_path.exists():
-                continue
+            for (entry, _, _), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    st.warning(f"Failed to load metadata from {entry.name}: {result}")
+                    continue
 
-            try:
-                metadata = GenerationMetadata.load(metadata_path)
-                projects.append((project_dir, metadata))
-            except Exception as e:
-                st.warning(f"Failed to load metadata from {project_dir.name}: {e}")
-                continue
+                projects.append((Path(entry.path), result))
 
         # Sort by timestamp (newest first)
-        projects.sort(key=lambda x: x[1].timestamp, reverse=True)
+        projects.sort(key=lambda x: x[1].timestamp_epoch, reverse=True)
 
         return projects
 
@@ -86,39 +192,28 @@ class OutputHistory:
         Returns:
             Filtered list of projects
         """
-        filtered = projects
-
-        if task:
-            filtered = [p for p in filtered if p[1].task == task]
-
-        if date_from:
-            filtered = [
-                p
-                for p in filtered
-                if datetime.fromisoformat(p[1].timestamp) >= date_from
-            ]
-
-        if date_to:
-            filtered = [
-                p for p in filtered if datetime.fromisoformat(p[1].timestamp) <= date_to
-            ]
-
-        if resolution:
-            filtered = [p for p in filtered if p[1].resolution == resolution]
-
-        if search_text:
-            search_lower = search_text.lower()
-            filtered = [
-                p
-                for p in filtered
-                if search_lower in p[1].user_prompt.lower()
-                or (
-                    p[1].extended_prompt
-                    and search_lower in p[1].extended_prompt.lower()
+        date_from_ts = date_from.timestamp() if date_from else None
+        date_to_ts = date_to.timestamp() if date_to else None
+        search_lower = search_text.lower() if search_text else None
+
+        def matches(metadata: GenerationMetadata) -> bool:
+            if task and metadata.task != task:
+                return False
+            if resolution and metadata.resolution != resolution:
+                return False
+            if date_from_ts is not None and metadata.timestamp_epoch < date_from_ts:
+                return False
+            if date_to_ts is not None and metadata.timestamp_epoch > date_to_ts:
+                return False
+            if search_lower:
+                return search_lower in metadata.user_prompt.lower() or bool(
+                    metadata.extended_prompt
+                    and search_lower in metadata.extended_prompt.lower()
                 )
-            ]
+            return True
 
-        return filtered
+        # Apply all filters in a single pass
+        return [p for p in projects if matches(p[1])]
 
     def get_recent(self, limit: int = 10) -> List[Tuple[Path, GenerationMetadata]]:
         """
@@ -130,8 +225,7 @@ class OutputHistory:
         Returns:
             List of recent projects
         """
-        projects = self.scan_projects()
-        return projects[:limit]
+        return self.scan_projects(limit=limit)
 
     def display_gallery_grid(
         self, projects: List[Tuple[Path, GenerationMetadata]], columns: int = 3
@@ -302,24 +396,32 @@ class OutputHistory:
             col1, col2 = st.columns(2)
 
             with col1:
-                # Create zip file in memory
-                zip_buffer = io.BytesIO()
-                with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-                    # Add all files from project directory
-                    for file_path in project_dir.rglob("*"):
-                        if file_path.is_file():
-                            arcname = file_path.relative_to(project_dir)
-                            zip_file.write(file_path, arcname)
-
-                zip_buffer.seek(0)
-
-                st.download_button(
-                    label="📥 Download Project",
-                    data=zip_buffer,
-                    file_name=f"{project_dir.name}.zip",
-                    mime="application/zip",
+                # Only build the archive once the user asks for it, and only
+                # one at a time: the request is cleared by the download itself
+                # or by preparing another project
+                zip_key = f"zip_requested_{project_dir.name}"
+                if st.session_state.get(zip_key):
+                    st.download_button(
+                        label="📥 Download Project",
+                        data=_build_project_zip(
+                            str(project_dir), _project_mtime_ns(project_dir)
+                        ),
+                        file_name=f"{project_dir.name}.zip",
+                        mime="application/zip",
+                        use_container_width=True,
+                        on_click=_clear_zip_request,
+                        args=(zip_key,),
+                    )
+                elif st.button(
+                    "📦 Prepare Download",
                     use_container_width=True,
-                )
+                    key=f"prepare_zip_{project_dir.name}",
+                ):
+                    for key in list(st.session_state):
+                        if key.startswith("zip_requested_"):
+                            del st.session_state[key]
+                    st.session_state[zip_key] = True
+                    st.rerun()
 
             with col2:
                 if st.button(
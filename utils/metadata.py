@@ -8,8 +8,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Optional faster JSON backend
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class GenerationMetadata:
     """Complete metadata for a video generation run."""
 
@@ -58,22 +63,54 @@ class GenerationMetadata:
     # Extra task-specific settings
     extra_settings: dict = field(default_factory=dict)
 
+    # Derived values (computed on construction, never serialized)
+    timestamp_epoch: float = field(init=False, repr=False, compare=False)
+    prompt_search_text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        try:
+            self.timestamp_epoch = datetime.fromisoformat(self.timestamp).timestamp()
+        except ValueError:
+            self.timestamp_epoch = 0.0
+        # Lowercased prompts for case-insensitive history search
+        self.prompt_search_text = (
+            f"{self.user_prompt}\n{self.extended_prompt or ''}".lower()
+        )
+
     def save(self, path: Path) -> None:
         """Save metadata to JSON file."""
         path.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            path.write_bytes(
+                orjson.dumps(
+                    self.to_dict(),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+            return
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(asdict(self), f, indent=2, ensure_ascii=False)
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
 
     @classmethod
     def load(cls, path: Path) -> "GenerationMetadata":
         """Load metadata from JSON file."""
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        for name in _DERIVED_FIELDS:
+            data.pop(name, None)
         return cls(**data)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        data = asdict(self)
+        for name in _DERIVED_FIELDS:
+            del data[name]
+        return data
+
+
+# Fields computed in __post_init__ rather than stored in metadata.json
+_DERIVED_FIELDS = ("timestamp_epoch", "prompt_search_text")
 
 
 def create_metadata(
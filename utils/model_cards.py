@@ -8,7 +8,7 @@ from typing import List, Optional
 import streamlit as st
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelCapability:
     """Represents a model's capabilities and specifications."""
 
@@ -19,8 +19,8 @@ class ModelCapability:
     resolution: str
     fps: int
     quality_rating: str  # "Fast", "Balanced", "High Quality"
-    key_features: List[str]
-    best_for: List[str]
+    key_features: tuple[str, ...]
+    best_for: tuple[str, ...]
     page_file: str
 
 
@@ -34,18 +34,18 @@ MODEL_CAPABILITIES = {
         resolution="1280x720 (16fps)",
         fps=16,
         quality_rating="High Quality",
-        key_features=[
+        key_features=(
             "Pure text-to-video generation",
             "MoE 14B model for high quality",
             "Multiple aspect ratios supported",
             "Cinematic prompt extension",
-        ],
-        best_for=[
+        ),
+        best_for=(
             "Creative scene generation",
             "Storytelling and narratives",
             "Cinematic sequences",
             "Conceptual visualizations",
-        ],
+        ),
         page_file="t2v_a14b.py"
     ),
     "i2v-A14B": ModelCapability(
@@ -56,18 +56,18 @@ MODEL_CAPABILITIES = {
         resolution="1280x720 (16fps)",
         fps=16,
         quality_rating="High Quality",
-        key_features=[
+        key_features=(
             "Image-guided video generation",
             "Natural motion synthesis",
             "Camera movement control",
             "Multiple aspect ratios",
-        ],
-        best_for=[
+        ),
+        best_for=(
             "Animating static images",
             "Adding life to photos",
             "Creating parallax effects",
             "Environmental scene animation",
-        ],
+        ),
         page_file="i2v_a14b.py"
     ),
     "ti2v-5B": ModelCapability(
@@ -78,18 +78,18 @@ MODEL_CAPABILITIES = {
         resolution="1280x720 (24fps)",
         fps=24,
         quality_rating="Fast",
-        key_features=[
+        key_features=(
             "Dual mode: T2V or I2V",
             "24fps output (faster)",
             "5B model for speed",
             "Good quality/speed balance",
-        ],
-        best_for=[
+        ),
+        best_for=(
             "Quick iterations",
             "Previews and concepts",
             "High-volume generation",
             "Prototyping ideas",
-        ],
+        ),
         page_file="ti2v_5b.py"
     ),
     "s2v-14B": ModelCapability(
@@ -100,18 +100,18 @@ MODEL_CAPABILITIES = {
         resolution="1024x704 (16fps)",
         fps=16,
         quality_rating="High Quality",
-        key_features=[
+        key_features=(
             "Audio-driven lip sync",
             "TTS with voice cloning",
             "Pose-driven control",
             "Natural facial expressions",
-        ],
-        best_for=[
+        ),
+        best_for=(
             "Talking head videos",
             "Virtual avatars",
             "Character dialogue",
             "Presentation videos",
-        ],
+        ),
         page_file="s2v_14b.py"
     ),
     "animate-14B": ModelCapability(
@@ -122,23 +122,58 @@ MODEL_CAPABILITIES = {
         resolution="1280x720 (30fps)",
         fps=30,
         quality_rating="High Quality",
-        key_features=[
+        key_features=(
             "Animation mode",
             "Replacement mode",
             "Pose retargeting",
             "Relighting LoRA support",
-        ],
-        best_for=[
+        ),
+        best_for=(
             "Character animation",
             "Face swapping",
             "Motion transfer",
             "Video composition",
-        ],
+        ),
         page_file="animate_14b.py"
     ),
 }
 
 
+def _build_card_html(capability: ModelCapability) -> str:
+    """Build the static HTML for a model capability card."""
+    features = "".join(f"<li>{feature}</li>" for feature in capability.key_features)
+    use_cases = "".join(f"<li>{use_case}</li>" for use_case in capability.best_for)
+    return (
+        f'<div class="model-card">'
+        f"<h3>{capability.icon} {capability.name}</h3>"
+        f"<p>{capability.description}</p>"
+        f'<div style="display: grid; grid-template-columns: repeat(3, 1fr); '
+        f'gap: 0.5rem; margin-bottom: 1rem;">'
+        f"<small><strong>Resolution</strong><br>{capability.resolution}</small>"
+        f"<small><strong>FPS</strong><br>{capability.fps}</small>"
+        f"<small><strong>Speed/Quality</strong><br>{capability.quality_rating}</small>"
+        f"</div>"
+        f"<details><summary>Key Features</summary><ul>{features}</ul></details>"
+        f"<details><summary>Best For</summary><ul>{use_cases}</ul></details>"
+        f"</div>"
+    )
+
+
+# Card HTML never changes at runtime, so render it once at import
+_CARD_HTML_CACHE: dict[str, str] = {
+    task: _build_card_html(capability)
+    for task, capability in MODEL_CAPABILITIES.items()
+}
+
+
+def _card_html(capability: ModelCapability) -> str:
+    """Get card HTML, using the precomputed copy for built-in capabilities."""
+    if MODEL_CAPABILITIES.get(capability.task) is capability:
+        return _CARD_HTML_CACHE[capability.task]
+    return _build_card_html(capability)
+
+
+@st.fragment
 def render_model_card(
     capability: ModelCapability,
     show_try_button: bool = True,
@@ -151,35 +186,13 @@ def render_model_card(
         capability: ModelCapability to render
         show_try_button: Whether to show the "Try Now" button
         on_click_callback: Optional callback when button is clicked
+
+    Runs as a fragment, so clicking "Try Now" reruns only this card rather
+    than the whole page.
     """
     with st.container():
-        # Card header
-        st.markdown(f"### {capability.icon} {capability.name}")
-
-        # Description
-        st.markdown(capability.description)
-
-        # Specs
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.caption("**Resolution**")
-            st.caption(capability.resolution)
-        with col2:
-            st.caption("**FPS**")
-            st.caption(f"{capability.fps}")
-        with col3:
-            st.caption("**Speed/Quality**")
-            st.caption(capability.quality_rating)
-
-        # Key features
-        with st.expander("Key Features"):
-            for feature in capability.key_features:
-                st.markdown(f"- {feature}")
-
-        # Best for
-        with st.expander("Best For"):
-            for use_case in capability.best_for:
-                st.markdown(f"- {use_case}")
+        # Header, description, specs and details in a single element
+        st.markdown(_card_html(capability), unsafe_allow_html=True)
 
         # Try now button
         if show_try_button:
@@ -206,6 +219,16 @@ def render_model_grid(
         columns: Number of columns in the grid
         show_try_button: Whether to show try buttons
     """
+    if not show_try_button:
+        # No widgets needed, so the whole grid is one element
+        cards = "".join(_card_html(capability) for capability in capabilities)
+        st.markdown(
+            f'<div style="display: grid; grid-template-columns: '
+            f'repeat({columns}, 1fr); gap: 1rem;">{cards}</div>',
+            unsafe_allow_html=True,
+        )
+        return
+
     cols = st.columns(columns)
 
     for idx, capability in enumerate(capabilities):
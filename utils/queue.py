@@ -5,53 +5,201 @@ All Streamlit sessions run in the same Python process, so a module-level singlet
 with threading locks coordinates access to prevent torchrun port conflicts.
 """
 
+import logging
 import threading
 import time
-from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable
 
 import streamlit as st
 
+# Longest a job may hold the generation slot before it is assumed lost. Covers
+# the 30 min preprocessing and 2 h generation timeouts with room to spare.
+MAX_JOB_DURATION_SECONDS = 3 * 60 * 60
+
+# Longest a waiting job may go without a heartbeat from its session. Waiters
+# check in at least once a second, so this only trips for abandoned entries.
+WAITER_TIMEOUT_SECONDS = 60
+
+
+@dataclass(slots=True)
+class JobInfo:
+    """A waiting or running generation job."""
+
+    task: str
+    prompt_preview: str
+    # Queue clock readings: when the job was queued, when its waiting session
+    # last checked in, and when it took the generation slot
+    submitted_at: float | None = None
+    last_seen_at: float | None = None
+    started_at: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class _QueueSnapshot:
+    """Immutable view of the queue state, replaced wholesale on every change."""
+
+    version: int = 0
+    positions: dict[str, int] = field(default_factory=dict)
+    active_info: JobInfo | None = None
+    head_info: JobInfo | None = None
+
+    @property
+    def queue_length(self) -> int:
+        return len(self.positions)
+
 
 class GenerationQueue:
     """Thread-safe queue that ensures only one generation runs at a time."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_job_duration: float = MAX_JOB_DURATION_SECONDS,
+        waiter_timeout: float = WAITER_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_job_duration = max_job_duration
+        self._waiter_timeout = waiter_timeout
+        self._clock = clock
+        # Guards mutations only; readers use the published _snapshot
         self._lock = threading.Lock()
-        self._queue: OrderedDict[str, dict] = OrderedDict()
+        # Signalled on every state change so waiters wake as soon as they can run
+        self._changed = threading.Condition(self._lock)
+        self._version = 0
+        # Plain dicts keep insertion order, which is the FIFO order we need
+        self._queue: dict[str, JobInfo] = {}
+        self._snapshot = _QueueSnapshot()
         self._active_job_id: str | None = None
-        self._active_info: dict | None = None
+        self._active_info: JobInfo | None = None
+
+    def _notify_changed(self) -> None:
+        """Record a state change and wake all waiters. Caller must hold the lock."""
+        self._version += 1
+        # Publish a fresh snapshot with a single reference assignment so the
+        # per-second status polls never need the lock
+        self._snapshot = _QueueSnapshot(
+            version=self._version,
+            positions={qid: i for i, qid in enumerate(self._queue)},
+            active_info=self._active_info,
+            head_info=next(iter(self._queue.values()), None),
+        )
+        self._changed.notify_all()
+
+    def _is_stale(self, info: JobInfo, now: float) -> bool:
+        """Whether a running job has outlived the maximum job duration."""
+        return now - info.started_at > self._max_job_duration
+
+    def _is_abandoned(self, info: JobInfo, now: float) -> bool:
+        """Whether a waiting job's session has stopped checking in."""
+        return now - info.last_seen_at > self._waiter_timeout
+
+    def _reap_stale_locked(self, now: float) -> None:
+        """
+        Drop jobs whose sessions are gone. Caller must hold the lock.
+
+        Sessions release or cancel on the way out, but a killed worker thread
+        or server-side crash can still leak the slot, or leave a dead entry
+        at the head of the queue that no live session will ever acquire past.
+        """
+        changed = False
+
+        info = self._active_info
+        if info is not None and self._is_stale(info, now):
+            logging.warning(
+                f"Reclaiming generation slot from job {self._active_job_id} "
+                f"({info.task}) after {now - info.started_at:.0f}s without release"
+            )
+            self._active_job_id = None
+            self._active_info = None
+            changed = True
+
+        abandoned = [
+            job_id
+            for job_id, info in self._queue.items()
+            if self._is_abandoned(info, now)
+        ]
+        for job_id in abandoned:
+            info = self._queue.pop(job_id)
+            logging.warning(
+                f"Dropping queued job {job_id} ({info.task}): no check-in for "
+                f"{now - info.last_seen_at:.0f}s"
+            )
+            changed = True
+
+        if changed:
+            self._notify_changed()
+
+    @property
+    def version(self) -> int:
+        """Counter that increases whenever the queue state changes."""
+        return self._snapshot.version
+
+    def wait_until_changed(self, version: int, timeout: float = 1.0) -> int:
+        """
+        Block until the queue state changes from ``version`` or timeout expires.
+
+        Returns the current version.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self._version != version, timeout)
+            return self._version
 
     def submit(self, job_id: str, task: str, prompt_preview: str) -> None:
         """Add a job to the queue."""
+        now = self._clock()
         with self._lock:
-            self._queue[job_id] = {
-                "task": task,
-                "prompt_preview": prompt_preview,
-            }
+            self._queue[job_id] = JobInfo(
+                task=task,
+                prompt_preview=prompt_preview,
+                submitted_at=now,
+                last_seen_at=now,
+            )
+            self._notify_changed()
+
+    def heartbeat(self, job_id: str) -> None:
+        """Record that a waiting job's session is still alive."""
+        # A single attribute store on the entry; no lock needed
+        info = self._queue.get(job_id)
+        if info is not None:
+            info.last_seen_at = self._clock()
 
     def get_position(self, job_id: str) -> int:
         """Get 0-based position in queue. Returns -1 if not found."""
-        with self._lock:
-            for i, qid in enumerate(self._queue):
-                if qid == job_id:
-                    return i
-            return -1
+        return self._snapshot.positions.get(job_id, -1)
 
     def get_queue_length(self) -> int:
         """Get number of waiting jobs."""
-        with self._lock:
-            return len(self._queue)
+        return self._snapshot.queue_length
 
-    def get_active_info(self) -> dict | None:
+    def get_active_info(self) -> JobInfo | None:
         """Get info about the currently running job, or None if idle."""
-        with self._lock:
-            if self._active_job_id is not None:
-                return self._active_info
-            return None
+        return self._snapshot.active_info
+
+    def get_status(self) -> tuple[int, JobInfo | None, int]:
+        """Get (version, active job info, queue length) from one consistent snapshot."""
+        snapshot = self._snapshot
+        return snapshot.version, snapshot.active_info, snapshot.queue_length
 
     def try_acquire(self, job_id: str) -> bool:
         """Try to acquire the generation slot. Returns True if acquired."""
+        # Lock-free pre-check: waiters poll this constantly and usually fail,
+        # so rule out the busy/not-first cases without contending for the lock.
+        # A stale snapshot can only reject early; success is rechecked below.
+        now = self._clock()
+        snapshot = self._snapshot
+        active = snapshot.active_info
+        if active is not None and not self._is_stale(active, now):
+            return False
+        head = snapshot.head_info
+        if (
+            snapshot.positions
+            and snapshot.positions.get(job_id) != 0
+            and not self._is_abandoned(head, now)
+        ):
+            return False
+
         with self._lock:
+            self._reap_stale_locked(now)
             if self._active_job_id is not None:
                 return False
             # Only the first job in queue can acquire
@@ -60,9 +208,13 @@ class GenerationQueue:
                 if first_id != job_id:
                     return False
             # Acquire
-            info = self._queue.pop(job_id, {"task": "unknown", "prompt_preview": ""})
+            info = self._queue.pop(job_id, None)
+            if info is None:
+                info = JobInfo(task="unknown", prompt_preview="", submitted_at=now)
+            info.started_at = now
             self._active_job_id = job_id
             self._active_info = info
+            self._notify_changed()
             return True
 
     def release(self, job_id: str) -> None:
@@ -71,17 +223,30 @@ class GenerationQueue:
             if self._active_job_id == job_id:
                 self._active_job_id = None
                 self._active_info = None
+                self._notify_changed()
 
     def cancel(self, job_id: str) -> None:
         """Remove a job from the queue (before it starts running)."""
         with self._lock:
-            self._queue.pop(job_id, None)
+            if self._queue.pop(job_id, None) is not None:
+                self._notify_changed()
 
 
 # Module-level singleton
 generation_queue = GenerationQueue()
 
 
+def _yield_to_streamlit() -> None:
+    """
+    Give Streamlit a chance to act on a pending stop or rerun request.
+
+    Streamlit only interrupts a running script inside st.* calls and
+    session_state access, so a wait loop that emits nothing must touch
+    session_state to stay stoppable. This is the cheapest such access.
+    """
+    st.session_state.get("_queue_wait_yield")
+
+
 def wait_for_queue_turn(job_id: str, cancellation_check=None) -> bool:
     """
     Wait until this job can run. Shows queue position in st.status if waiting.
@@ -93,50 +258,89 @@ def wait_for_queue_turn(job_id: str, cancellation_check=None) -> bool:
         return True
 
     # Need to wait — show queue UI
-    with st.status("Waiting in queue...", expanded=True) as status:
-        while True:
-            # Check cancellation
-            if cancellation_check and cancellation_check():
-                generation_queue.cancel(job_id)
-                status.update(label="Cancelled while waiting in queue", state="error")
-                return False
+    try:
+        with st.status("Waiting in queue...", expanded=True) as status:
+            last_shown = None
+            while True:
+                # Position updates are skipped when nothing changed, so yield
+                # explicitly; otherwise a page without a cancellation check
+                # could not be stopped until the queue moved
+                _yield_to_streamlit()
+                generation_queue.heartbeat(job_id)
 
-            # Try to acquire
-            if generation_queue.try_acquire(job_id):
-                status.update(label="Queue position acquired", state="complete")
-                return True
+                # Read the version before checking state so a change that
+                # lands after the check still wakes the wait below
+                version = generation_queue.version
+
+                # Check cancellation
+                if cancellation_check and cancellation_check():
+                    generation_queue.cancel(job_id)
+                    status.update(
+                        label="Cancelled while waiting in queue", state="error"
+                    )
+                    return False
 
-            # Show position
-            pos = generation_queue.get_position(job_id)
-            active = generation_queue.get_active_info()
-            if pos >= 0:
-                msg = f"Position in queue: {pos + 1}"
-                if active:
-                    msg += f" (running: {active['task']})"
-                st.write(msg)
-                status.update(label=f"Waiting in queue (position {pos + 1})...")
+                # Try to acquire
+                if generation_queue.try_acquire(job_id):
+                    status.update(label="Queue position acquired", state="complete")
+                    return True
 
-            time.sleep(1)
+                # Show position, but only when it or the running job changed,
+                # so a waiter parked at the same position does not emit an
+                # update on every wakeup
+                pos = generation_queue.get_position(job_id)
+                active = generation_queue.get_active_info()
+                shown = (pos, active.task if active else None)
+                if pos >= 0 and shown != last_shown:
+                    last_shown = shown
+                    msg = f"Position in queue: {pos + 1}"
+                    if active:
+                        msg += f" (running: {active.task})"
+                    st.write(msg)
+                    status.update(
+                        label=f"Waiting in queue (position {pos + 1})..."
+                    )
+
+                # Wake immediately on release/cancel; the timeout keeps the
+                # cancellation check and status display responsive
+                generation_queue.wait_until_changed(version, timeout=1.0)
+    except BaseException:
+        # A Streamlit stop/rerun (or any error) unwinds through here; drop
+        # the entry so it cannot block the head of the queue
+        generation_queue.cancel(job_id)
+        raise
+
+
+# (queue version, message) from the last get_queue_status_message() call
+_status_cache: tuple[int, str | None] | None = None
 
 
 def get_queue_status_message() -> str | None:
     """
     Get a human-readable queue status string, or None if idle.
 
+    The message is rebuilt only when the queue state has changed since the
+    last call.
+
     Returns messages like:
     - "1 generation running"
     - "1 generation running, 2 in queue"
     """
-    active = generation_queue.get_active_info()
-    queue_len = generation_queue.get_queue_length()
+    global _status_cache
 
-    if active is None and queue_len == 0:
-        return None
+    version, active, queue_len = generation_queue.get_status()
+    cached = _status_cache
+    if cached is not None and cached[0] == version:
+        return cached[1]
 
-    parts = []
-    if active is not None:
-        parts.append(f"1 generation running ({active['task']})")
-    if queue_len > 0:
-        parts.append(f"{queue_len} in queue")
+    message = None
+    if active is not None or queue_len > 0:
+        parts = []
+        if active is not None:
+            parts.append(f"1 generation running ({active.task})")
+        if queue_len > 0:
+            parts.append(f"{queue_len} in queue")
+        message = ", ".join(parts)
 
-    return ", ".join(parts)
+    _status_cache = (version, message)
+    return message
@@ -2,16 +2,8 @@
 Sidebar utilities for consistent branding across pages.
 """
 
-import sys
-from pathlib import Path
-
 import streamlit as st
 
-# Add assets directory to path for badge imports
-assets_path = Path(__file__).parent.parent / "assets"
-if assets_path.exists() and str(assets_path) not in sys.path:
-    sys.path.insert(0, str(assets_path))
-
 from assets import render_hpe_badge, render_wan22_badge
 
 
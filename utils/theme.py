@@ -2,20 +2,67 @@
 Theme utilities for WanUI Studio - Obsidian Precision design system.
 """
 
+import re
 from pathlib import Path
 
 import streamlit as st
 
 
+STREAMLIT_DIR = Path(__file__).parent.parent / ".streamlit"
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_SPACE_RE = re.compile(r"\s*([{};,>])\s*")
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    return _CSS_PUNCT_SPACE_RE.sub(r"\1", css).strip()
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _style_html(css_path: str, mtime_ns: int) -> str:
+    """Read and minify a stylesheet once per file version as a <style> tag."""
+    with open(css_path) as f:
+        return f"<style>{minify_css(f.read())}</style>"
+
+
+def load_css_file(css_file: Path):
+    """
+    Inject a stylesheet from disk into the page.
+
+    The file is only re-read when its mtime changes, so edits still show up
+    without restarting the server.
+
+    Args:
+        css_file: Path to the CSS file; missing files are skipped
+    """
+    try:
+        mtime_ns = css_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return
+    st.markdown(_style_html(str(css_file), mtime_ns), unsafe_allow_html=True)
+
+
+# Header markup; the styling lives in custom.css under PAGE & SECTION HEADERS
+_PAGE_HEADER_TEMPLATE = (
+    '<div class="wanui-page-header">'
+    "<h1>{icon_html}{title}</h1><p>{description}</p>"
+    "</div>"
+)
+_PAGE_HEADER_ICON_TEMPLATE = '<span class="wanui-page-header-icon">{icon}</span>'
+_SECTION_HEADER_TEMPLATE = '<h3 class="wanui-section-header">{title}</h3>{desc_html}'
+_SECTION_DESCRIPTION_TEMPLATE = '<p class="wanui-section-description">{description}</p>'
+
+
 def load_custom_theme():
     """
     Load the Obsidian Precision custom CSS theme.
     Call this at the start of each page for consistent styling.
     """
-    css_file = Path(__file__).parent.parent / ".streamlit" / "custom.css"
-    if css_file.exists():
-        with open(css_file) as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+    load_css_file(STREAMLIT_DIR / "custom.css")
 
 
 def render_page_header(title: str, description: str, icon: str = ""):
@@ -27,31 +74,11 @@ def render_page_header(title: str, description: str, icon: str = ""):
         description: Brief description of the page
         icon: Optional emoji icon
     """
-    icon_html = f'<span style="margin-right: 0.75rem;">{icon}</span>' if icon else ""
-
+    icon_html = _PAGE_HEADER_ICON_TEMPLATE.format(icon=icon) if icon else ""
     st.markdown(
-        f"""
-        <div style="margin-bottom: 2rem;">
-            <h1 style="
-                font-family: 'Outfit', sans-serif;
-                font-size: 2.5rem;
-                font-weight: 700;
-                margin-bottom: 0.75rem;
-                display: flex;
-                align-items: center;
-            ">
-                {icon_html}{title}
-            </h1>
-            <p style="
-                font-size: 1.05rem;
-                color: #a0a0a0;
-                margin: 0;
-                line-height: 1.6;
-            ">
-                {description}
-            </p>
-        </div>
-        """,
+        _PAGE_HEADER_TEMPLATE.format(
+            icon_html=icon_html, title=title, description=description
+        ),
         unsafe_allow_html=True,
     )
 
@@ -65,21 +92,11 @@ def render_section_header(title: str, description: str = ""):
         description: Optional description
     """
     desc_html = (
-        f'<p style="color: #a0a0a0; margin-bottom: 1.5rem; font-size: 0.95rem;">{description}</p>'
+        _SECTION_DESCRIPTION_TEMPLATE.format(description=description)
         if description
         else ""
     )
-
     st.markdown(
-        f"""
-        <h3 style="
-            font-family: 'Outfit', sans-serif;
-            font-weight: 600;
-            font-size: 1.5rem;
-            margin-top: 2rem;
-            margin-bottom: 0.5rem;
-        ">{title}</h3>
-        {desc_html}
-        """,
+        _SECTION_HEADER_TEMPLATE.format(title=title, desc_html=desc_html),
         unsafe_allow_html=True,
     )
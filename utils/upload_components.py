@@ -2,11 +2,17 @@
 Enhanced file upload components with preview and styling.
 """
 
+import io
 from pathlib import Path
 from typing import Optional, List
 
 import streamlit as st
 
+from utils.styling import apply_custom_theme
+
+# Longest side of the downscaled image shown in upload previews
+PREVIEW_MAX_SIZE = 800
+
 
 def enhanced_file_uploader(
     label: str,
@@ -17,6 +23,9 @@ def enhanced_file_uploader(
     """
     Enhanced file uploader with custom styling and preview.
 
+    Upload zone styles come from the shared stylesheet, so call
+    apply_custom_theme() (or apply_upload_styling()) once on the page.
+
     Args:
         label: Label for the uploader
         accepted_types: List of accepted file extensions (e.g., ["jpg", "png"])
@@ -26,18 +35,6 @@ def enhanced_file_uploader(
     Returns:
         Uploaded file or None
     """
-    # Custom CSS for styled upload zone
-    st.markdown("""
-        <style>
-        .uploadedFile {
-            border: 2px dashed #4CAF50;
-            border-radius: 8px;
-            padding: 10px;
-            background-color: rgba(76, 175, 80, 0.1);
-        }
-        </style>
-    """, unsafe_allow_html=True)
-
     uploaded_file = st.file_uploader(
         label,
         type=accepted_types,
@@ -51,6 +48,26 @@ def enhanced_file_uploader(
     return uploaded_file
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def _image_preview(file_id: str, _data: bytes) -> bytes:
+    """
+    Downscale an uploaded image for its preview, once per upload.
+
+    Keyed on the upload's file_id so the (possibly large) bytes are not
+    hashed on every rerun.
+    """
+    from PIL import Image
+
+    with Image.open(io.BytesIO(_data)) as img:
+        img.thumbnail((PREVIEW_MAX_SIZE, PREVIEW_MAX_SIZE))
+        buffer = io.BytesIO()
+        if img.mode in ("RGBA", "LA", "P"):
+            img.save(buffer, format="PNG")
+        else:
+            img.convert("RGB").save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+
 def display_file_preview(uploaded_file) -> None:
     """
     Display preview and info for an uploaded file.
@@ -66,7 +83,10 @@ def display_file_preview(uploaded_file) -> None:
         with col1:
             # Display preview based on file type
             if file_type == 'image':
-                st.image(uploaded_file, use_container_width=True)
+                st.image(
+                    _image_preview(uploaded_file.file_id, uploaded_file.getvalue()),
+                    use_container_width=True,
+                )
             elif file_type == 'video':
                 st.video(uploaded_file)
             elif file_type == 'audio':
@@ -75,39 +95,21 @@ def display_file_preview(uploaded_file) -> None:
                 st.info("Preview not available for this file type")
 
         with col2:
-            # Display file info
-            st.write("**File Info:**")
-            st.write(f"Name: `{uploaded_file.name}`")
-            st.write(f"Size: {uploaded_file.size / 1024:.1f} KB")
-            st.write(f"Type: {uploaded_file.type}")
+            # Display file info as one element rather than one per line
+            st.markdown(
+                "**File Info:**\n\n"
+                f"Name: `{uploaded_file.name}`\n\n"
+                f"Size: {uploaded_file.size / 1024:.1f} KB\n\n"
+                f"Type: {uploaded_file.type}"
+            )
 
 
 def apply_upload_styling():
     """
     Apply custom CSS for upload components.
     Call this at the start of pages that use enhanced uploads.
+
+    Upload styles are part of the shared theme stylesheet, so pages that
+    already call apply_custom_theme() do not need this.
     """
-    st.markdown("""
-        <style>
-        /* Styled upload zone */
-        .stFileUploader > div {
-            border: 2px dashed #4CAF50;
-            border-radius: 8px;
-            padding: 20px;
-            background-color: rgba(76, 175, 80, 0.05);
-            transition: all 0.3s ease;
-        }
-
-        .stFileUploader > div:hover {
-            border-color: #45a049;
-            background-color: rgba(76, 175, 80, 0.1);
-        }
-
-        /* File preview styling */
-        .stExpander {
-            border: 1px solid #ddd;
-            border-radius: 4px;
-            margin: 10px 0;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    apply_custom_theme()
@@ -2,30 +2,167 @@
 Input validation utilities for uploaded media files.
 """
 
-import subprocess
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
-from PIL import Image
+import streamlit as st
 
+try:
+    import orjson
+except ImportError:  # Optional faster JSON backend
+    orjson = None
 
-@dataclass
+try:
+    import imagesize
+except ImportError:  # Optional header-only image size parsing; falls back to PIL
+    imagesize = None
+
+# Probes mostly wait on file I/O or an ffprobe subprocess, so threads overlap well
+VALIDATION_WORKERS = 8
+
+# Aspect ratios (width / height) that validate_image accepts without a warning
+STANDARD_ASPECT_RATIOS = (16 / 9, 9 / 16, 4 / 3, 3 / 4, 1.0)
+ASPECT_RATIO_TOLERANCE = 0.1
+
+# Containers the upload widgets accept; anything else is rejected before probing
+VIDEO_EXTENSIONS = frozenset({".mp4", ".mov", ".avi", ".mkv", ".webm"})
+AUDIO_EXTENSIONS = frozenset({".wav", ".mp3", ".m4a", ".aac", ".flac", ".ogg"})
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation check."""
 
     valid: bool
     message: str
-    warnings: list[str] = None
+    # Immutable so results without warnings share the empty tuple
+    warnings: tuple[str, ...] = ()
 
     def __post_init__(self):
         if self.warnings is None:
-            self.warnings = []
+            self.warnings = ()
+
+
+def _unsupported_extension(
+    path: Path, extensions: frozenset, kind: str
+) -> Optional[ValidationResult]:
+    """A failed ValidationResult if path's suffix is not allowed, else None."""
+    suffix = Path(path).suffix.lower()
+    if suffix in extensions:
+        return None
+    supported = ", ".join(sorted(ext.lstrip(".") for ext in extensions))
+    return ValidationResult(
+        valid=False,
+        message=(
+            f"Unsupported {kind} format '{suffix or 'none'}'. "
+            f"Use one of: {supported}."
+        ),
+    )
+
+
+def _file_version(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) identifying a file's contents, or None if missing."""
+    try:
+        stat = Path(path).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=1)
+def _load_av():
+    """
+    Import PyAV on first use, or return None if it is not installed.
+
+    PyAV loads the libav shared libraries, so pages that never validate media
+    should not pay for it at import time.
+    """
+    try:
+        import av
+    except ImportError:  # Optional in-process media probing; falls back to ffprobe
+        return None
+    return av
+
+
+def _image_size(image_path: Path) -> Tuple[int, int]:
+    """Image (width, height), parsed from the file header when possible."""
+    if imagesize is not None:
+        width, height = imagesize.get(str(image_path))
+        if width > 0 and height > 0:
+            return width, height
+    # Unknown to imagesize (or not installed); PIL only reads the header here
+    from PIL import Image
+
+    with Image.open(image_path) as img:
+        return img.size
+
+
+def _json_loads(raw: bytes):
+    """Parse JSON with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    import json
+
+    return json.loads(raw)
+
+
+def _parse_fraction(value: str) -> float:
+    """Parse an ffprobe rate such as "30000/1001" or "25"; 0 if undefined."""
+    numerator, _, denominator = value.partition("/")
+    denominator = int(denominator or 1)
+    return int(numerator) / denominator if denominator else 0.0
+
+
+def _av_duration(container) -> float:
+    """Container duration in seconds, or 0 if unknown."""
+    if container.duration is None:
+        return 0.0
+    return container.duration / _load_av().time_base
+
+
+def _get_video_info_av(video_path: Path) -> Optional[dict]:
+    """Read video information from the container header with PyAV."""
+    try:
+        with _load_av().open(str(video_path)) as container:
+            video_stream = next(iter(container.streams.video), None)
+            if video_stream is None:
+                return None
+            rate = video_stream.base_rate or video_stream.average_rate
+            return {
+                "width": video_stream.codec_context.width,
+                "height": video_stream.codec_context.height,
+                "duration": _av_duration(container),
+                "fps": float(rate) if rate else 0.0,
+                "codec": video_stream.codec_context.name,
+            }
+    except (OSError, _load_av().FFmpegError):
+        # Unreadable or not a media file; anything else is a bug worth seeing
+        return None
+
+
+def _get_audio_info_av(audio_path: Path) -> Optional[dict]:
+    """Read audio information from the container header with PyAV."""
+    try:
+        with _load_av().open(str(audio_path)) as container:
+            audio_stream = next(iter(container.streams.audio), None)
+            if audio_stream is None:
+                return None
+            return {
+                "duration": _av_duration(container),
+                "sample_rate": audio_stream.codec_context.sample_rate,
+                "channels": audio_stream.codec_context.channels,
+                "codec": audio_stream.codec_context.name,
+            }
+    except (OSError, _load_av().FFmpegError):
+        return None
 
 
 def get_video_info(video_path: Path) -> Optional[dict]:
     """
-    Get video information using ffprobe.
+    Get video information using PyAV, or ffprobe if PyAV is not installed.
 
     Args:
         video_path: Path to video file
@@ -33,30 +170,33 @@ def get_video_info(video_path: Path) -> Optional[dict]:
     Returns:
         Dictionary with video info or None if failed
     """
+    if _load_av() is not None:
+        return _get_video_info_av(video_path)
+
+    import subprocess
+
     try:
         cmd = [
             "ffprobe",
             "-v", "quiet",
+            "-select_streams", "v:0",
+            "-show_entries", "stream=width,height,codec_name,r_frame_rate:format=duration",
             "-print_format", "json",
-            "-show_format",
-            "-show_streams",
             str(video_path)
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        # Keep stdout as bytes; both JSON backends parse bytes directly
+        result = subprocess.run(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=10
+        )
 
         if result.returncode != 0:
             return None
 
-        import json
-        data = json.loads(result.stdout)
-
-        # Find video stream
-        video_stream = None
-        for stream in data.get("streams", []):
-            if stream.get("codec_type") == "video":
-                video_stream = stream
-                break
+        data = _json_loads(result.stdout)
 
+        # Only the first video stream is requested
+        streams = data.get("streams") or [None]
+        video_stream = streams[0]
         if not video_stream:
             return None
 
@@ -66,7 +206,7 @@ def get_video_info(video_path: Path) -> Optional[dict]:
             "width": int(video_stream.get("width", 0)),
             "height": int(video_stream.get("height", 0)),
             "duration": duration,
-            "fps": eval(video_stream.get("r_frame_rate", "0/1")),
+            "fps": _parse_fraction(video_stream.get("r_frame_rate", "0/1")),
             "codec": video_stream.get("codec_name", "unknown"),
         }
 
@@ -76,7 +216,7 @@ def get_video_info(video_path: Path) -> Optional[dict]:
 
 def get_audio_info(audio_path: Path) -> Optional[dict]:
     """
-    Get audio information using ffprobe.
+    Get audio information using PyAV, or ffprobe if PyAV is not installed.
 
     Args:
         audio_path: Path to audio file
@@ -84,30 +224,33 @@ def get_audio_info(audio_path: Path) -> Optional[dict]:
     Returns:
         Dictionary with audio info or None if failed
     """
+    if _load_av() is not None:
+        return _get_audio_info_av(audio_path)
+
+    import subprocess
+
     try:
         cmd = [
             "ffprobe",
             "-v", "quiet",
+            "-select_streams", "a:0",
+            "-show_entries", "stream=sample_rate,channels,codec_name:format=duration",
             "-print_format", "json",
-            "-show_format",
-            "-show_streams",
             str(audio_path)
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        # Keep stdout as bytes; both JSON backends parse bytes directly
+        result = subprocess.run(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=10
+        )
 
         if result.returncode != 0:
             return None
 
-        import json
-        data = json.loads(result.stdout)
-
-        # Find audio stream
-        audio_stream = None
-        for stream in data.get("streams", []):
-            if stream.get("codec_type") == "audio":
-                audio_stream = stream
-                break
+        data = _json_loads(result.stdout)
 
+        # Only the first audio stream is requested
+        streams = data.get("streams") or [None]
+        audio_stream = streams[0]
         if not audio_stream:
             return None
 
@@ -128,6 +271,9 @@ def validate_image(image_path: Path, task: str) -> ValidationResult:
     """
     Validate an image for a specific task.
 
+    Results are cached per file version, so reruns on the same upload do
+    not probe it again.
+
     Args:
         image_path: Path to image file
         task: Task name (e.g., "i2v-A14B")
@@ -135,12 +281,27 @@ def validate_image(image_path: Path, task: str) -> ValidationResult:
     Returns:
         ValidationResult
     """
+    version = _file_version(image_path)
+    if version is None:
+        return _validate_image(image_path, task)
+    return _validate_image_cached(str(image_path), *version, task)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _validate_image_cached(
+    image_path: str, mtime_ns: int, size: int, task: str
+) -> ValidationResult:
+    """Cached validate_image, keyed by path, mtime and size."""
+    return _validate_image(Path(image_path), task)
+
+
+def _validate_image(image_path: Path, task: str) -> ValidationResult:
+    """Validate an image without caching."""
     warnings = []
 
     try:
-        with Image.open(image_path) as img:
-            width, height = img.size
-            aspect_ratio = width / height
+        width, height = _image_size(image_path)
+        aspect_ratio = width / height
 
         # Check resolution
         if width < 480 or height < 480:
@@ -150,8 +311,10 @@ def validate_image(image_path: Path, task: str) -> ValidationResult:
             )
 
         # Warn about non-standard aspect ratios
-        standard_ratios = [16/9, 9/16, 4/3, 3/4, 1/1]
-        if not any(abs(aspect_ratio - ratio) < 0.1 for ratio in standard_ratios):
+        if not any(
+            abs(aspect_ratio - ratio) < ASPECT_RATIO_TOLERANCE
+            for ratio in STANDARD_ASPECT_RATIOS
+        ):
             warnings.append(
                 f"Unusual aspect ratio {aspect_ratio:.2f}. "
                 "Standard ratios (16:9, 9:16, 4:3, etc.) work best."
@@ -176,7 +339,7 @@ def validate_image(image_path: Path, task: str) -> ValidationResult:
         return ValidationResult(
             valid=True,
             message=f"Image valid: {width}x{height}",
-            warnings=warnings
+            warnings=tuple(warnings),
         )
 
     except Exception as e:
@@ -190,6 +353,9 @@ def validate_video(video_path: Path, task: str) -> ValidationResult:
     """
     Validate a video for a specific task.
 
+    Results are cached per file version, so reruns on the same upload do
+    not probe it again.
+
     Args:
         video_path: Path to video file
         task: Task name (e.g., "animate-14B")
@@ -197,6 +363,26 @@ def validate_video(video_path: Path, task: str) -> ValidationResult:
     Returns:
         ValidationResult
     """
+    unsupported = _unsupported_extension(video_path, VIDEO_EXTENSIONS, "video")
+    if unsupported is not None:
+        return unsupported
+
+    version = _file_version(video_path)
+    if version is None:
+        return _validate_video(video_path, task)
+    return _validate_video_cached(str(video_path), *version, task)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _validate_video_cached(
+    video_path: str, mtime_ns: int, size: int, task: str
+) -> ValidationResult:
+    """Cached validate_video, keyed by path, mtime and size."""
+    return _validate_video(Path(video_path), task)
+
+
+def _validate_video(video_path: Path, task: str) -> ValidationResult:
+    """Validate a video without caching."""
     warnings = []
 
     info = get_video_info(video_path)
@@ -241,7 +427,7 @@ def validate_video(video_path: Path, task: str) -> ValidationResult:
     return ValidationResult(
         valid=True,
         message=f"Video valid: {width}x{height}, {duration:.1f}s @ {fps:.1f} FPS",
-        warnings=warnings
+        warnings=tuple(warnings),
     )
 
 
@@ -249,6 +435,9 @@ def validate_audio(audio_path: Path, task: str) -> ValidationResult:
     """
     Validate an audio file for a specific task.
 
+    Results are cached per file version, so reruns on the same upload do
+    not probe it again.
+
     Args:
         audio_path: Path to audio file
         task: Task name (e.g., "s2v-14B")
@@ -256,6 +445,26 @@ def validate_audio(audio_path: Path, task: str) -> ValidationResult:
     Returns:
         ValidationResult
     """
+    unsupported = _unsupported_extension(audio_path, AUDIO_EXTENSIONS, "audio")
+    if unsupported is not None:
+        return unsupported
+
+    version = _file_version(audio_path)
+    if version is None:
+        return _validate_audio(audio_path, task)
+    return _validate_audio_cached(str(audio_path), *version, task)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _validate_audio_cached(
+    audio_path: str, mtime_ns: int, size: int, task: str
+) -> ValidationResult:
+    """Cached validate_audio, keyed by path, mtime and size."""
+    return _validate_audio(Path(audio_path), task)
+
+
+def _validate_audio(audio_path: Path, task: str) -> ValidationResult:
+    """Validate an audio file without caching."""
     warnings = []
 
     info = get_audio_info(audio_path)
@@ -291,5 +500,35 @@ def validate_audio(audio_path: Path, task: str) -> ValidationResult:
     return ValidationResult(
         valid=True,
         message=f"Audio valid: {duration:.1f}s @ {sample_rate} Hz",
-        warnings=warnings
+        warnings=tuple(warnings),
     )
+
+
+def validate_files(
+    paths: Sequence[Path], task: str, kind: str
+) -> List[ValidationResult]:
+    """
+    Validate several files of the same kind concurrently.
+
+    Args:
+        paths: Paths to the files to validate
+        task: Task name (e.g., "animate-14B")
+        kind: One of "image", "video" or "audio"
+
+    Returns:
+        ValidationResults in the same order as paths
+    """
+    validators = {
+        "image": validate_image,
+        "video": validate_video,
+        "audio": validate_audio,
+    }
+    if kind not in validators:
+        raise ValueError(f"Unknown media kind: {kind}")
+    validate = validators[kind]
+
+    if len(paths) <= 1:
+        return [validate(path, task) for path in paths]
+
+    with ThreadPoolExecutor(max_workers=min(VALIDATION_WORKERS, len(paths))) as pool:
+        return list(pool.map(lambda path: validate(path, task), paths))